@@ -1,4 +1,5 @@
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 from requests import get, post, put, delete
 from .fixtures import create_collection, upsert_random_points
@@ -128,7 +129,8 @@ def read_requests(peer_url, expected_status):
         }),
     ]
 
-    execute_requests(peer_url, expected_status, TESTS)
+    # Reads are independent of each other, so probe them all at once
+    execute_requests(peer_url, expected_status, TESTS, concurrent=True)
 
 def write_requests(peer_url, first_request_expected_status, following_requests_expected_status):
     TESTS = [
@@ -195,17 +197,35 @@ def collection_snapshot_and_collection_delete(peer_url, check_failure=True):
 def base_url(peer_url):
     return f"{peer_url}/collections/{COLLECTION_NAME}"
 
-def execute_requests(peer_url, expected_status, tests):
-    for method, url, *payload in tests:
-        resp = method(
+def execute_requests(peer_url, expected_status, tests, concurrent=False):
+    def execute(test):
+        method, url, *payload = test
+        return method(
             f"{base_url(peer_url)}/{url}",
             json=payload[0] if payload else None,
         )
 
-        assert_http_response(resp, expected_status, method.__name__.upper(), url)
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            resps = list(executor.map(execute, tests))
+    else:
+        resps = [execute(test) for test in tests]
+
+    # Report every unexpected response at once, not just the first one
+    errors = [
+        unexpected_response_message(resp, expected_status, method.__name__.upper(), url)
+        for (method, url, *_), resp in zip(tests, resps)
+        if resp.status_code != expected_status
+    ]
+
+    if errors:
+        pytest.fail("\n".join(errors))
 
 def assert_http_response(resp, expected_status, method, url):
     assert expected_status == resp.status_code, \
-        f"`{method} {url}` "\
+        unexpected_response_message(resp, expected_status, method, url)
+
+def unexpected_response_message(resp, expected_status, method, url):
+    return f"`{method} {url}` "\
         f"returned an unexpected response (expected {expected_status}, received {resp.status_code}): "\
-        f"{resp.json()}"
+        f"{resp.text}"
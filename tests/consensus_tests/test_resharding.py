@@ -1,6 +1,7 @@
 import multiprocessing
 import pathlib
 import random
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 
 from .test_dummy_shard import assert_http_response
@@ -10,6 +11,13 @@ from .utils import *
 
 COLLECTION_NAME = "test_collection"
 
+# Reuse connections to the peers across requests made by this module
+# Background processes spawned by `run_in_background` must not share it, they use `requests` directly
+session = requests.Session()
+
+# Poll cluster state often at first to catch fast transitions, then back off
+POLL_BACKOFF = {"wait_for_interval": 0.05, "wait_for_max_interval": 0.5}
+
 
 # Test resharding.
 #
@@ -47,7 +55,7 @@ def test_resharding(tmp_path: pathlib.Path):
         assert check_collection_local_shards_point_count(uri, COLLECTION_NAME, num_points)
 
     # We cannot reshard down now, because we only have one shard
-    r = requests.post(
+    r = session.post(
         f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
             "start_resharding": {
                 "direction": "down"
@@ -59,7 +67,7 @@ def test_resharding(tmp_path: pathlib.Path):
     # Reshard up 3 times in sequence
     for shard_count in range(2, 5):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "up"
@@ -82,7 +90,7 @@ def test_resharding(tmp_path: pathlib.Path):
     # Match all points on all nodes exactly
     data = []
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                 "limit": 999999999,
                 "with_vectors": True,
@@ -96,7 +104,7 @@ def test_resharding(tmp_path: pathlib.Path):
     # Reshard down 3 times in sequence
     for shard_count in range(3, 0, -1):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "down"
@@ -119,7 +127,7 @@ def test_resharding(tmp_path: pathlib.Path):
     # Match all points on all nodes exactly
     data = []
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                 "limit": 999999999,
                 "with_vectors": True,
@@ -167,7 +175,7 @@ def test_resharding_balance(tmp_path: pathlib.Path):
     # If that is not the case, move the replica there now
     if get_collection_local_shards_count(peer_api_uris[0], COLLECTION_NAME) == 0:
         second_peer_id = get_cluster_info(peer_api_uris[1])['peer_id']
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "move_shard": {
                     "shard_id": 0,
@@ -187,7 +195,7 @@ def test_resharding_balance(tmp_path: pathlib.Path):
     # Reshard 5 times in sequence
     for _shard_count in range(5):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "up",
@@ -270,7 +278,7 @@ def test_resharding_concurrent_updates(tmp_path: pathlib.Path):
     # Reshard 3 times in sequence
     for shard_count in range(2, 5):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "up"
@@ -305,7 +313,7 @@ def test_resharding_concurrent_updates(tmp_path: pathlib.Path):
     # not seen this yet. Once it does, we probably want to remove this.
     data = []
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                 "limit": 999999999,
                 "with_vectors": True,
@@ -352,7 +360,7 @@ def test_resharding_stable_point_count(tmp_path: pathlib.Path):
     # Reshard 3 times in sequence
     for shard_count in range(2, 5):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "up"
@@ -388,7 +396,7 @@ def test_resharding_stable_point_count(tmp_path: pathlib.Path):
     # Match all points on all nodes exactly
     data = []
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                 "limit": 999999999,
                 "with_vectors": True,
@@ -436,7 +444,7 @@ def test_resharding_indexing_stable_point_count(tmp_path: pathlib.Path):
     # Reshard 3 times in sequence
     for shard_count in range(2, 5):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "up"
@@ -476,7 +484,7 @@ def test_resharding_indexing_stable_point_count(tmp_path: pathlib.Path):
     # Match all points on all nodes exactly
     data = []
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                 "limit": 999999999,
                 "with_vectors": True,
@@ -524,7 +532,7 @@ def test_resharding_stable_scroll(tmp_path: pathlib.Path):
     # Match scroll sample of points on all nodes exactly
     data = []
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                 "limit": scroll_limit,
                 "with_vectors": True,
@@ -538,7 +546,7 @@ def test_resharding_stable_scroll(tmp_path: pathlib.Path):
     # Reshard 3 times in sequence
     for shard_count in range(2, 5):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "up"
@@ -555,7 +563,7 @@ def test_resharding_stable_scroll(tmp_path: pathlib.Path):
             # Match scroll sample of points on all nodes exactly
             data = []
             for uri in peer_api_uris:
-                r = requests.post(
+                r = session.post(
                     f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                         "limit": scroll_limit,
                         "with_vectors": True,
@@ -616,7 +624,7 @@ def test_resharding_stable_query(tmp_path: pathlib.Path):
     data = []
     search_vector = random_dense_vector()
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/query", json={
                 "vector": search_vector,
                 "limit": query_limit,
@@ -629,7 +637,7 @@ def test_resharding_stable_query(tmp_path: pathlib.Path):
     # Reshard 3 times in sequence
     for shard_count in range(2, 5):
         # Start resharding
-        r = requests.post(
+        r = session.post(
             f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
                 "start_resharding": {
                     "direction": "up"
@@ -647,7 +655,7 @@ def test_resharding_stable_query(tmp_path: pathlib.Path):
             data = []
             search_vector = random_dense_vector()
             for uri in peer_api_uris:
-                r = requests.post(
+                r = session.post(
                     f"{uri}/collections/{COLLECTION_NAME}/points/query", json={
                         "vector": search_vector,
                         "limit": query_limit,
@@ -710,7 +718,7 @@ def test_resharding_resume_on_restart(tmp_path: pathlib.Path):
         assert check_collection_local_shards_point_count(uri, COLLECTION_NAME, num_points)
 
     # Start resharding
-    r = requests.post(
+    r = session.post(
         f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
             "start_resharding": {
                 "direction": "up",
@@ -726,8 +734,9 @@ def test_resharding_resume_on_restart(tmp_path: pathlib.Path):
         wait_for_collection_resharding_operation_stage(peer_api_uris[0], COLLECTION_NAME, stage)
 
         # Kill and restart first peer
+        # Wait for it to be completely gone instead of sleeping, to be able to reuse the data on disk
         first_peer_process.kill()
-        sleep(1)
+        first_peer_process.proc.wait()
         peer_api_uris[0] = start_peer(peer_dirs[0], "peer_0_restarted.log", bootstrap_uri, extra_env=env)
         first_peer_process = processes.pop()
         wait_for_peer_online(peer_api_uris[0], "/")
@@ -747,7 +756,7 @@ def test_resharding_resume_on_restart(tmp_path: pathlib.Path):
     # Match all points on all nodes exactly
     data = []
     for uri in peer_api_uris:
-        r = requests.post(
+        r = session.post(
             f"{uri}/collections/{COLLECTION_NAME}/points/scroll", json={
                 "limit": 999999999,
                 "with_vectors": True,
@@ -765,7 +774,7 @@ def test_resharding_abort(tmp_path: pathlib.Path):
     peer_api_uris, peer_ids = bootstrap_resharding(tmp_path)
 
     # Abort resharding
-    resp = requests.post(
+    resp = session.post(
         f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
             "abort_resharding": {}
         }
@@ -793,7 +802,7 @@ def test_resharding_try_abort_after_write_hash_ring_committed(tmp_path: pathlib.
     )
 
     # Try to abort resharding
-    resp = requests.post(
+    resp = session.post(
         f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
             "abort_resharding": {}
         }
@@ -810,7 +819,7 @@ def test_resharding_abort_on_delete_collection(tmp_path: pathlib.Path):
     peer_api_uris, peer_ids = bootstrap_resharding(tmp_path)
 
     # Delete collection
-    resp = requests.delete(f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}")
+    resp = session.delete(f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}")
     assert_http_ok(resp)
 
     # TODO: Check... *something*? What? 🤔
@@ -825,7 +834,7 @@ def test_resharding_abort_on_delete_shard_key(tmp_path: pathlib.Path):
     )
 
     # Delete shard key
-    resp = requests.post(
+    resp = session.post(
         f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/shards/delete", json={
             "shard_key": "custom_shard_key_2",
         }
@@ -844,7 +853,7 @@ def test_resharding_abort_on_remove_peer(tmp_path: pathlib.Path):
     peer_api_uris, peer_ids = bootstrap_resharding(tmp_path, replication_peer_idx=-1)
 
     # Remove peer
-    resp = requests.delete(f"{peer_api_uris[0]}/cluster/peer/{peer_ids[-1]}?force=true")
+    resp = session.delete(f"{peer_api_uris[0]}/cluster/peer/{peer_ids[-1]}?force=true")
     assert_http_ok(resp)
 
     # Wait for resharding to abort
@@ -863,7 +872,7 @@ def test_resharding_restart_on_remove_peer_during_replicate(tmp_path: pathlib.Pa
     peer_to_remove = info['to']
 
     # Remove peer
-    resp = requests.delete(f"{peer_api_uris[0]}/cluster/peer/{info['to']}?force=true")
+    resp = session.delete(f"{peer_api_uris[0]}/cluster/peer/{info['to']}?force=true")
     assert_http_ok(resp)
 
     # Wait for resharding to restart
@@ -886,7 +895,7 @@ def test_resharding_try_abort_on_remove_shard_before_replicate(tmp_path: pathlib
     peer_api_uris, peer_ids = bootstrap_resharding(tmp_path)
 
     # Try to remove new shard (before it has been replicated at least once)
-    resp = requests.post(f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
+    resp = session.post(f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
         "drop_replica": {
             "peer_id": peer_ids[0],
             "shard_id": 3,
@@ -912,7 +921,7 @@ def resharding_restart_on_remove_shard_during_replicate(tmp_path: pathlib.Path,
     info = wait_for_resharding_shard_transfer_info(peer_api_uris[0], 'replicate', 'stream_records')
 
     # Remove replica of the new shard
-    resp = requests.post(f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
+    resp = session.post(f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
         "drop_replica": {
             "peer_id": info[shard_to_remove],
             "shard_id": 3,
@@ -937,7 +946,7 @@ def bootstrap_resharding(
     peer_api_uris, peer_ids = bootstrap_cluster(tmp_path, shard_keys=shard_keys)
 
     # Start resharding
-    resp = requests.post(
+    resp = session.post(
         f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/cluster", json={
             "start_resharding": {
                 "direction": "up",
@@ -949,7 +958,7 @@ def bootstrap_resharding(
     assert_http_ok(resp)
 
     # Wait for resharding to start
-    wait_for_collection_resharding_operations_count(peer_api_uris[0], COLLECTION_NAME, 1)
+    wait_for_collection_resharding_operations_count(peer_api_uris[0], COLLECTION_NAME, 1, **POLL_BACKOFF)
 
     return (peer_api_uris, peer_ids)
 
@@ -970,9 +979,9 @@ def bootstrap_cluster(
 
     peer_api_uris, _peer_dirs, _bootstrap_uri = start_cluster(tmp_path, 3, None, extra_env=env)
 
-    peer_ids = []
-    for peer_uri in peer_api_uris:
-        peer_ids.append(get_cluster_info(peer_uri)['peer_id'])
+    # Query peers concurrently, requests are independent
+    with ThreadPoolExecutor(max_workers=len(peer_api_uris)) as executor:
+        peer_ids = list(executor.map(lambda peer_uri: get_cluster_info(peer_uri)['peer_id'], peer_api_uris))
 
     # Create collection
     create_collection(
@@ -995,7 +1004,7 @@ def bootstrap_cluster(
     for shard_key in shard_keys:
         # Create custom shard key (if required)
         if shard_key is not None:
-            resp = requests.put(
+            resp = session.put(
                 f"{peer_api_uris[0]}/collections/{COLLECTION_NAME}/shards", json={
                     "shard_key": shard_key,
                     "shards_number": shard_number,
@@ -1014,8 +1023,6 @@ def bootstrap_cluster(
 
 def wait_for_one_of_resharding_operation_stages(peer_uri: str, expected_stages: list[str], **kwargs):
     def resharding_operation_stages():
-        requests.post(f"{peer_uri}/collections/{COLLECTION_NAME}/points/scroll")
-
         info = get_collection_cluster_info(peer_uri, COLLECTION_NAME)
 
         if 'resharding_operations' not in info:
@@ -1032,30 +1039,36 @@ def wait_for_one_of_resharding_operation_stages(peer_uri: str, expected_stages:
 
         return False
 
-    wait_for(resharding_operation_stages, **kwargs)
+    wait_for(resharding_operation_stages, **{**POLL_BACKOFF, **kwargs})
 
 def wait_for_resharding_shard_transfer_info(peer_uri: str, expected_stage: str | None, expected_method: str):
     if expected_stage is not None:
-        wait_for_collection_resharding_operation_stage(peer_uri, COLLECTION_NAME, expected_stage)
+        wait_for_collection_resharding_operation_stage(peer_uri, COLLECTION_NAME, expected_stage, **POLL_BACKOFF)
 
-    wait_for_collection_shard_transfer_method(peer_uri, COLLECTION_NAME, expected_method)
+    wait_for_collection_shard_transfer_method(peer_uri, COLLECTION_NAME, expected_method, **POLL_BACKOFF)
 
     info = get_collection_cluster_info(peer_uri, COLLECTION_NAME)
     return info['shard_transfers'][0]
 
 def wait_for_resharding_to_finish(peer_uris: list[str], expected_shard_number: int):
-    # Wait for resharding to finish
-    for peer_uri in peer_uris:
-        wait_for_collection_resharding_operations_count(
-            peer_uri,
-            COLLECTION_NAME,
-            0,
-            wait_for_timeout=60,
-        )
-
-    # Check number of shards in the collection
-    for peer_uri in peer_uris:
-        resp = get_collection_cluster_info(peer_uri, COLLECTION_NAME)
+    # Wait on all peers concurrently, so the total wait is the slowest peer rather than the sum
+    with ThreadPoolExecutor(max_workers=len(peer_uris)) as executor:
+        # Wait for resharding to finish
+        list(executor.map(
+            lambda peer_uri: wait_for_collection_resharding_operations_count(
+                peer_uri,
+                COLLECTION_NAME,
+                0,
+                wait_for_timeout=60,
+                **POLL_BACKOFF,
+            ),
+            peer_uris,
+        ))
+
+        # Check number of shards in the collection
+        infos = list(executor.map(lambda peer_uri: get_collection_cluster_info(peer_uri, COLLECTION_NAME), peer_uris))
+
+    for resp in infos:
         assert resp['shard_count'] == expected_shard_number
 
 
@@ -1,10 +1,12 @@
 import json
 import os
+import random
 import re
 import shutil
 from subprocess import Popen
 import time
 from typing import Tuple, Callable, Dict, List
+import orjson
 import requests
 import socket
 from contextlib import closing
@@ -242,7 +244,8 @@ def fetch_highest_peer_id(peer_api_uris: [str]) -> str:
 def get_collection_cluster_info(peer_api_uri: str, collection_name: str, headers={}) -> dict:
     r = requests.get(f"{peer_api_uri}/collections/{collection_name}/cluster", headers=headers)
     assert_http_ok(r)
-    res = r.json()["result"]
+    # Polled in tight loops by the wait helpers, parse with orjson
+    res = orjson.loads(r.content)["result"]
     return res
 
 
@@ -455,13 +458,8 @@ def check_collection_shard_transfer_progress(peer_api_uri: str, collection_name:
 
 def check_all_replicas_active(peer_api_uri: str, collection_name: str, headers={}) -> bool:
     collection_cluster_info = get_collection_cluster_info(peer_api_uri, collection_name, headers=headers)
-    for shard in collection_cluster_info["local_shards"]:
-        if shard['state'] != 'Active':
-            return False
-    for shard in collection_cluster_info["remote_shards"]:
-        if shard['state'] != 'Active':
-            return False
-    return True
+    replicas = collection_cluster_info["local_shards"] + collection_cluster_info["remote_shards"]
+    return all(shard['state'] == 'Active' for shard in replicas)
 
 
 def check_some_replicas_not_active(peer_api_uri: str, collection_name: str) -> bool:
@@ -546,9 +544,9 @@ def wait_for_collection_shard_transfers_count(peer_api_uri: str, collection_name
 
 
 def wait_for_collection_shard_transfer_method(peer_api_uri: str, collection_name: str,
-                                              expected_method: str):
+                                              expected_method: str, **kwargs):
     try:
-        wait_for(check_collection_shard_transfer_method, peer_api_uri, collection_name, expected_method)
+        wait_for(check_collection_shard_transfer_method, peer_api_uri, collection_name, expected_method, **kwargs)
     except Exception as e:
         print_collection_cluster_info(peer_api_uri, collection_name)
         raise e
@@ -576,9 +574,9 @@ def wait_for_collection_resharding_operations_count(peer_api_uri: str,
         raise e
 
 
-def wait_for_collection_resharding_operation_stage(peer_api_uri: str, collection_name: str, expected_stage: str, headers={}):
+def wait_for_collection_resharding_operation_stage(peer_api_uri: str, collection_name: str, expected_stage: str, headers={}, **kwargs):
     try:
-        wait_for(check_collection_resharding_operation_stage, peer_api_uri, collection_name, expected_stage, headers=headers)
+        wait_for(check_collection_resharding_operation_stage, peer_api_uri, collection_name, expected_stage, headers=headers, **kwargs)
     except Exception as e:
         print_collection_cluster_info(peer_api_uri, collection_name, headers=headers)
         raise e
@@ -592,15 +590,26 @@ def wait_for_collection_local_shards_count(peer_api_uri: str, collection_name: s
         raise e
 
 
-def wait_for(condition: Callable[..., bool], *args, wait_for_timeout=WAIT_TIME_SEC, wait_for_interval=RETRY_INTERVAL_SEC, **kwargs):
+def wait_for(condition: Callable[..., bool], *args, wait_for_timeout=WAIT_TIME_SEC, wait_for_interval=RETRY_INTERVAL_SEC,
+             wait_for_max_interval=None, **kwargs):
+    """
+    Polls `condition` every `wait_for_interval` seconds until it is satisfied.
+
+    If `wait_for_max_interval` is given, the interval doubles after every attempt up to that limit,
+    with random jitter, so fast transitions are caught early without hammering the peers later on.
+    """
     start = time.time()
+    interval = wait_for_interval
     while not condition(*args, **kwargs):
         elapsed = time.time() - start
         if elapsed > wait_for_timeout:
             raise Exception(
                 f"Timeout waiting for condition {condition.__name__} to be satisfied in {wait_for_timeout} seconds")
+        elif wait_for_max_interval is None:
+            time.sleep(interval)
         else:
-            time.sleep(wait_for_interval)
+            time.sleep(random.uniform(interval / 2, interval))
+            interval = min(interval * 2, wait_for_max_interval)
 
 
 def peer_is_online(peer_api_uri: str, path: str = "/readyz") -> bool:
@@ -46,7 +46,8 @@ if [ "$MODE" == "distributed" ]; then
   sleep 10
 fi
 
-pytest tests/openapi
+# Pass PYTEST_MARKERS="not slow" to skip expensive test variants
+pytest tests/openapi -m "${PYTEST_MARKERS:-}"
 
 ./tests/basic_api_test.sh
 
@@ -3,6 +3,28 @@ import pytest
 import socketserver
 import threading
 
+from .helpers.collection_setup import (
+    basic_collection_setup,
+    create_collection_snapshot,
+    delete_collection_snapshot,
+    download_collection_snapshot,
+    drop_collection,
+)
+from .helpers.helpers import SESSION
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: expensive variant of a test, deselect with '-m \"not slow\"'")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def http_session():
+    """
+    The keep-alive session all helpers send requests through, closed once the test run is over.
+    """
+    yield SESSION
+    SESSION.close()
+
 
 @pytest.fixture(params=[False, True], scope="module")
 def on_disk_vectors(request):
@@ -14,6 +36,29 @@ def on_disk_payload(request):
     return request.param
 
 
+@pytest.fixture(scope="session")
+def basic_collection_snapshot():
+    """
+    Returns a function giving a snapshot of `basic_collection_setup` for `on_disk_vectors`.
+    Modules recover their own collection from it instead of building and seeding one,
+    so the seed collection is built once per test run.
+    """
+    snapshots = {}
+
+    def get(on_disk_vectors):
+        collection_name = f'test_collection_seed_{"on_disk" if on_disk_vectors else "in_memory"}'
+        if collection_name not in snapshots:
+            basic_collection_setup(collection_name=collection_name, on_disk_vectors=on_disk_vectors)
+            snapshot_name = create_collection_snapshot(collection_name)
+            snapshots[collection_name] = download_collection_snapshot(snapshot_name, collection_name)
+            # Only the downloaded copy is needed, snapshot files would outlive the collection
+            delete_collection_snapshot(snapshot_name, collection_name)
+            drop_collection(collection_name)
+        return snapshots[collection_name]
+
+    return get
+
+
 @pytest.fixture
 def http_server(tmpdir):
     """
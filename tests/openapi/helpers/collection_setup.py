@@ -1,5 +1,9 @@
+import random
+from typing import Dict, Iterable, Optional
 
-from .helpers import request_with_validation
+import orjson
+
+from .helpers import request_with_validation, seed_points_fast
 
 
 def drop_collection(collection_name='test_collection'):
@@ -11,6 +15,95 @@ def drop_collection(collection_name='test_collection'):
     assert response.ok
 
 
+def create_collection_snapshot(collection_name='test_collection') -> str:
+    response = request_with_validation(
+        api='/collections/{collection_name}/snapshots',
+        method="POST",
+        path_params={'collection_name': collection_name},
+        query_params={'wait': 'true'},
+    )
+    assert response.ok
+    return response.json()['result']['name']
+
+
+def download_collection_snapshot(snapshot_name: str, collection_name='test_collection') -> bytes:
+    response = request_with_validation(
+        api='/collections/{collection_name}/snapshots/{snapshot_name}',
+        method="GET",
+        path_params={'collection_name': collection_name, 'snapshot_name': snapshot_name},
+    )
+    assert response.ok
+    return response.content
+
+
+def recover_collection_from(snapshot: bytes, collection_name='test_collection'):
+    """
+    Recreates the collection from the uploaded `snapshot`, which may have been taken of another collection.
+    An existing collection would keep its own config, so it is dropped first.
+    """
+    drop_collection(collection_name)
+
+    response = request_with_validation(
+        api='/collections/{collection_name}/snapshots/upload',
+        method="POST",
+        path_params={'collection_name': collection_name},
+        query_params={'wait': 'true', 'priority': 'snapshot'},
+        files={'snapshot': ('snapshot.tar', snapshot)},
+    )
+    assert response.ok, response.text
+
+
+def delete_collection_snapshot(snapshot_name: str, collection_name='test_collection'):
+    response = request_with_validation(
+        api='/collections/{collection_name}/snapshots/{snapshot_name}',
+        method="DELETE",
+        path_params={'collection_name': collection_name, 'snapshot_name': snapshot_name},
+        query_params={'wait': 'true'},
+    )
+    assert response.ok
+
+
+def batch_update(collection_name: str, operations: list):
+    """
+    Applies `operations` (`upsert`, `set_payload`, `delete_payload`, `clear_payload`, ...)
+    in order with a single `points/batch` request, waiting for all of them to be applied.
+    """
+    response = request_with_validation(
+        api='/collections/{collection_name}/points/batch',
+        method="POST",
+        path_params={'collection_name': collection_name},
+        query_params={'wait': 'true'},
+        body={"operations": operations},
+    )
+    assert response.ok, response.text
+    return response
+
+
+def setup_aux_collection(collection_name: str, vectors: dict, encoded_points: bytes):
+    """
+    Creates a secondary collection with the given vectors config and seeds it with pre-serialized points.
+    A leftover from an interrupted run is dropped first.
+    """
+    response = request_with_validation(
+        api='/collections/{collection_name}/exists',
+        method="GET",
+        path_params={'collection_name': collection_name},
+    )
+    assert response.ok
+    if response.json()['result']['exists']:
+        drop_collection(collection_name)
+
+    response = request_with_validation(
+        api='/collections/{collection_name}',
+        method="PUT",
+        path_params={'collection_name': collection_name},
+        body={"vectors": vectors},
+    )
+    assert response.ok, response.text
+
+    seed_points_fast(collection_name, encoded_points)
+
+
 def geo_collection_setup(
         collection_name='test_collection',
         on_disk_payload=False,
@@ -140,7 +233,11 @@ def basic_collection_setup(
             "on_disk_payload": on_disk_payload,
             "wal_config": {
                 "wal_capacity_mb": wal_capacity,
-            }
+            },
+            # Never build a vector index for the handful of seed points
+            "optimizers_config": {
+                "indexing_threshold": 0,
+            },
         }
     )
     assert response.ok
@@ -152,76 +249,126 @@ def basic_collection_setup(
     )
     assert response.ok
 
+    basic_collection_seed(collection_name)
+
+
+def minimal_collection_setup(
+        collection_name: str,
+        ids: Iterable[int],
+        on_disk_vectors=False,
+        payloads: Optional[Dict[int, dict]] = None,
+):
+    """
+    Lighter alternative to `basic_collection_setup` for tests that only need some points to exist.
+    Creates a collection with the same dense vectors config and upserts just `ids`,
+    with vectors that are random but fixed per id.
+    Points get the payload given for them in `payloads`, none otherwise.
+    """
+    drop_collection(collection_name)
+
     response = request_with_validation(
-        api='/collections/{collection_name}/points',
+        api='/collections/{collection_name}',
         method="PUT",
         path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
         body={
-            "points": [
-                {
-                    "id": 1,
-                    "vector": [0.05, 0.61, 0.76, 0.74],
-                    "payload": {"city": "Berlin", "price": 10.0}
-                },
-                {
-                    "id": 2,
-                    "vector": [0.19, 0.81, 0.75, 0.11],
-                    "payload": {"city": ["Berlin", "London"], "price": 11.0}
-                },
-                {
-                    "id": 3,
-                    "vector": [0.36, 0.55, 0.47, 0.94],
-                    "payload": {"city": ["Berlin", "Moscow"], "price": 9.5}
-                },
-                {
-                    "id": 4,
-                    "vector": [0.18, 0.01, 0.85, 0.80],
-                    "payload": {"city": ["London", "Moscow"], "price": 9}
-                },
-                {
-                    "id": 5,
-                    "vector": [0.24, 0.18, 0.22, 0.44],
-                    "payload": {"count": 0}
-                },
-                {
-                    "id": 6,
-                    "vector": [0.35, 0.08, 0.11, 0.44]
-                },
-                {
-                    "id": 7,
-                    "vector": [0.25, 0.98, 0.14, 0.43],
-                    "payload": {"city": None, "price": None}
-                },
-                {
-                    "id": 8,
-                    "vector": [0.79, 0.53, 0.72, 0.15],
-                    "payload": {"city": [], "price": []}
-                },
-                {
-                    "id": 9,
-                    "vector": {
-                        "sparse-text": {
-                            "indices": [66, 12],
-                            "values": [0.5, 0.5]
-                        }
-                    }
-                },
-                {
-                    "id": 10,
-                    "vector": {
-                        "sparse-text": {
-                            "indices": [1, 2, 3],
-                            "values": [0.1, 0.2, 0.3]
-                        }
-                    },
-                    "payload": {"city": [], "price": []}
-                }
-            ]
+            "vectors": {
+                "size": 4,
+                "distance": "Dot",
+                "on_disk": on_disk_vectors,
+            },
+            "optimizers_config": {
+                "indexing_threshold": 0,
+            },
         }
     )
     assert response.ok
 
+    payloads = payloads or {}
+    points = []
+    for point_id in ids:
+        rng = random.Random(point_id)
+        point = {"id": point_id, "vector": [round(rng.random(), 2) for _ in range(4)]}
+        if point_id in payloads:
+            point["payload"] = payloads[point_id]
+        points.append(point)
+    seed_points_fast(collection_name, orjson.dumps({"points": points}))
+
+
+BASIC_COLLECTION_POINTS = {
+    "points": [
+        {
+            "id": 1,
+            "vector": [0.05, 0.61, 0.76, 0.74],
+            "payload": {"city": "Berlin", "price": 10.0}
+        },
+        {
+            "id": 2,
+            "vector": [0.19, 0.81, 0.75, 0.11],
+            "payload": {"city": ["Berlin", "London"], "price": 11.0}
+        },
+        {
+            "id": 3,
+            "vector": [0.36, 0.55, 0.47, 0.94],
+            "payload": {"city": ["Berlin", "Moscow"], "price": 9.5}
+        },
+        {
+            "id": 4,
+            "vector": [0.18, 0.01, 0.85, 0.80],
+            "payload": {"city": ["London", "Moscow"], "price": 9}
+        },
+        {
+            "id": 5,
+            "vector": [0.24, 0.18, 0.22, 0.44],
+            "payload": {"count": 0}
+        },
+        {
+            "id": 6,
+            "vector": [0.35, 0.08, 0.11, 0.44]
+        },
+        {
+            "id": 7,
+            "vector": [0.25, 0.98, 0.14, 0.43],
+            "payload": {"city": None, "price": None}
+        },
+        {
+            "id": 8,
+            "vector": [0.79, 0.53, 0.72, 0.15],
+            "payload": {"city": [], "price": []}
+        },
+        {
+            "id": 9,
+            "vector": {
+                "sparse-text": {
+                    "indices": [66, 12],
+                    "values": [0.5, 0.5]
+                }
+            }
+        },
+        {
+            "id": 10,
+            "vector": {
+                "sparse-text": {
+                    "indices": [1, 2, 3],
+                    "values": [0.1, 0.2, 0.3]
+                }
+            },
+            "payload": {"city": [], "price": []}
+        }
+    ]
+}
+
+# The seed never changes, serialize it once for every setup
+_BASIC_COLLECTION_POINTS_JSON = orjson.dumps(BASIC_COLLECTION_POINTS)
+
+
+def basic_collection_seed(collection_name='test_collection'):
+    """
+    (Re-)upserts the points of `basic_collection_setup`, restoring any of them
+    that a test has deleted or modified.
+    """
+    seed_points_fast(collection_name, _BASIC_COLLECTION_POINTS_JSON)
+
+
 def multipayload_collection_setup(
     collection_name='test_collection',
     on_disk_payload=False,
@@ -1,11 +1,23 @@
-from typing import Any, Dict, List
-import jsonschema
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+import orjson
 import requests
-from schemathesis.models import APIOperation
-from schemathesis.specs.openapi.references import ConvertingResolver
-from schemathesis.specs.openapi.schemas import OpenApi30
+from requests.adapters import HTTPAdapter
 
-from .settings import QDRANT_HOST, SCHEMA
+from .settings import QDRANT_HOST, VALIDATE, get_schema
+
+# jsonschema and schemathesis are slow to import, they are only imported once a request is made
+if TYPE_CHECKING:
+    import jsonschema
+    from schemathesis.models import APIOperation
+
+# Shared across all tests, so keep-alive connections to the server are reused
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=64, pool_maxsize=64))
+SESSION.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64))
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
 
 
 def get_api_string(host, api, path_params):
@@ -16,20 +28,73 @@ def get_api_string(host, api, path_params):
     return f"{host}{api}".format(**path_params)
 
 
-def validate_schema(data, operation_schema: OpenApi30, raw_definitions):
+@functools.lru_cache(maxsize=None)
+def get_operation(api: str, method: str) -> 'APIOperation':
+    return get_schema()[api][method]
+
+
+# Validators below are built once per operation (and status code).
+# `jsonschema.validate`, also used by schemathesis' `validate_response`, checks the schema itself
+# and resolves references from scratch on every call, reusing the validator avoids that.
+@functools.lru_cache(maxsize=None)
+def get_request_validator(api: str, method: str) -> 'jsonschema.Draft7Validator':
+    import jsonschema
+    from schemathesis.specs.openapi.references import ConvertingResolver
+
+    operation = get_operation(api, method)
+    resolver = ConvertingResolver(
+        operation.schema.location or "",
+        operation.schema.raw_schema,
+        nullable_name=operation.schema.nullable_name,
+        is_response_schema=False
+    )
+    return jsonschema.Draft7Validator(
+        operation.definition.raw['requestBody']['content']['application/json']['schema'],
+        resolver=resolver,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_response_validator(api: str, method: str, status_code: int) -> Optional['jsonschema.Validator']:
     """
-    :param data: concrete values to validate
-    :param operation_schema: operation schema
-    :param raw_definitions: definitions to check data with
-    :return:
+    Same checks as schemathesis' `validate_response`: the schema of the exact status code, or the default one.
+    None if the response has no schema.
     """
+    import jsonschema
+    from schemathesis.specs.openapi.references import ConvertingResolver
+
+    operation = get_operation(api, method)
+    responses = {str(key): value for key, value in operation.definition.raw.get("responses", {}).items()}
+    definition = responses.get(str(status_code), responses.get("default"))
+    if definition is None:
+        return None
+
+    scopes, schema = operation.schema.get_response_schema(definition, operation.definition.scope)
+    if not schema:
+        return None
+
     resolver = ConvertingResolver(
-        operation_schema.location or "",
-        operation_schema.raw_schema,
-        nullable_name=operation_schema.nullable_name,
-        is_response_schema=False
+        operation.schema.location or "",
+        operation.schema.raw_schema,
+        nullable_name=operation.schema.nullable_name,
+        is_response_schema=True
     )
-    jsonschema.validate(data, raw_definitions, cls=jsonschema.Draft7Validator, resolver=resolver)
+    for scope in scopes:
+        resolver.push_scope(scope)
+
+    # `get_schema` only accepts OpenAPI 3.0, which schemathesis checks with Draft 4
+    return jsonschema.Draft4Validator(
+        schema,
+        resolver=resolver,
+        format_checker=jsonschema.Draft202012Validator.FORMAT_CHECKER,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def is_json_content_type(content_type: str) -> bool:
+    from schemathesis.transports.content_types import is_json_media_type
+
+    return is_json_media_type(content_type)
 
 
 def request_with_validation(
@@ -37,24 +102,90 @@ def request_with_validation(
         method: str,
         path_params: dict = None,
         query_params: dict = None,
-        body: dict = None
+        body: dict = None,
+        files: dict = None,
+        expected_status: Optional[Union[int, Tuple[int, ...]]] = None,
+        validate_response: bool = True,
 ) -> requests.Response:
-    operation: APIOperation = SCHEMA[api][method]
+    """
+    :param body: request body, validated against the schema and serialized with orjson
+    :param files: files sent as a multipart body instead of `body`, e.g. for snapshot uploads
+    :param expected_status: if given, fail unless the response has this status (or one of these statuses)
+    :param validate_response: validate the response body against the schema,
+        skip for repeated calls whose response shape is already covered by an earlier validated call.
+        Neither request nor response is validated when QDRANT_TEST_VALIDATE=0
+    """
+    response, _ = _request_with_validation(
+        api, method, path_params, query_params, body, files, expected_status, validate_response
+    )
+    return response
 
-    assert isinstance(operation.schema, OpenApi30)
+
+def _request_with_validation(
+        api: str,
+        method: str,
+        path_params: dict = None,
+        query_params: dict = None,
+        body: dict = None,
+        files: dict = None,
+        expected_status: Optional[Union[int, Tuple[int, ...]]] = None,
+        validate_response: bool = True,
+) -> Tuple[requests.Response, Any]:
+    """
+    `request_with_validation`, also returning the response body if it was parsed for validation, None otherwise.
+    """
+    url, query_params = _validate_request(api, method, path_params, query_params, body)
+
+    encoded_body = orjson.dumps(body) if body is not None else None
+
+    response = SESSION.request(
+        method=method,
+        url=url,
+        params=query_params,
+        data=encoded_body,
+        files=files,
+        headers=JSON_HEADERS if encoded_body is not None else None,
+    )
+
+    parsed = _validate_response(api, method, response, body, expected_status, validate_response)
+
+    return response, parsed
+
+
+@dataclass
+class Resp:
+    """
+    Response of `request_json_with_validation`, with the body parsed once.
+    """
+    ok: bool
+    json: Any
+    response: requests.Response
+
+
+def request_json_with_validation(*args, **kwargs) -> Resp:
+    """
+    Same as `request_with_validation`, for call sites that check the body several times:
+    `resp.json` is parsed once instead of on every `response.json()` call.
+    """
+    response, parsed = _request_with_validation(*args, **kwargs)
+    if parsed is None and response.content:
+        parsed = orjson.loads(response.content)
+    return Resp(ok=response.ok, json=parsed, response=response)
+
+
+def _validate_request(api: str, method: str, path_params: Optional[dict], query_params: Optional[dict], body):
+    if not VALIDATE:
+        return get_api_string(QDRANT_HOST, api, path_params or {}), query_params
+
+    operation = get_operation(api, method)
 
     if body:
-        validate_schema(
-            data=body,
-            operation_schema=operation.schema,
-            raw_definitions=operation.definition.raw['requestBody']['content']['application/json']['schema']
-        )
+        get_request_validator(api, method).validate(body)
 
     if path_params is None:
         path_params = {}
     if query_params is None:
         query_params = {}
-    action = getattr(requests, method.lower(), None)
 
     for param in operation.path_parameters.items:
         if param.is_required:
@@ -70,17 +201,48 @@ def request_with_validation(
     for param in query_params.keys():
         assert param in set(p.name for p in operation.query.items)
 
-    if not action:
-        raise RuntimeError(f"Method {method} does not exists")
+    return get_api_string(QDRANT_HOST, api, path_params), query_params
 
-    response = action(
-        url=get_api_string(QDRANT_HOST, api, path_params),
-        params=query_params,
-        json=body
-    )
 
-    operation.validate_response(response)
+def _validate_response(api: str, method: str, response, body, expected_status, validate_response: bool):
+    """
+    Returns the response body if it was parsed for validation, None otherwise.
+    """
+    parsed = None
+    if validate_response and VALIDATE:
+        validator = get_response_validator(api, method, response.status_code)
+        content_type = response.headers.get('Content-Type')
+        if validator is not None and content_type is None:
+            # Let schemathesis report the missing header
+            get_operation(api, method).validate_response(response)
+        elif validator is not None and is_json_content_type(content_type):
+            parsed = orjson.loads(response.content)
+            validator.validate(parsed)
 
+    if expected_status is not None:
+        expected = (expected_status,) if isinstance(expected_status, int) else expected_status
+        assert response.status_code in expected, \
+            f"`{method} {response.url}` returned {response.status_code}, expected {expected_status}\n" \
+            f"request body: {body}\n" \
+            f"response body: {response.text}"
+
+    return parsed
+
+
+def seed_points_fast(collection_name: str, encoded_points: bytes) -> requests.Response:
+    """
+    Upserts points without any schema validation.
+    Only for fixed seed data known to be valid, e.g. a body pre-serialized at import time.
+
+    :param encoded_points: `PointInsertOperations` body serialized to JSON
+    """
+    response = SESSION.put(
+        url=f"{QDRANT_HOST}/collections/{collection_name}/points",
+        params={'wait': 'true'},
+        data=encoded_points,
+        headers=JSON_HEADERS,
+    )
+    assert response.ok, response.text
     return response
 
 # from client implementation:
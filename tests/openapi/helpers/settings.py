@@ -1,9 +1,25 @@
+import functools
 import os
 
-import schemathesis
-
 ROOT_DIR = os.path.dirname(__file__)
 OPENAPI_FILE = os.environ.get("OPENAPI_FILE", os.path.join(os.path.dirname(ROOT_DIR), '../../docs/redoc/master', 'openapi.json'))
 
-SCHEMA = schemathesis.from_file(open(OPENAPI_FILE))
 QDRANT_HOST = os.environ.get("QDRANT_HOST", "http://localhost:6333")
+
+# Set QDRANT_TEST_VALIDATE=0 to skip checking requests and responses against the OpenAPI schema
+VALIDATE = os.environ.get("QDRANT_TEST_VALIDATE", "1") == "1"
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema():
+    """
+    Parsed OpenAPI schema. Loaded (together with schemathesis) on first use
+    instead of at import, so collecting tests doesn't pay for it.
+    """
+    import schemathesis
+    from schemathesis.specs.openapi.schemas import OpenApi30
+
+    with open(OPENAPI_FILE) as openapi_file:
+        schema = schemathesis.from_file(openapi_file)
+    assert isinstance(schema, OpenApi30)
+    return schema
@@ -1,19 +1,24 @@
 import pytest
 
-from .helpers.collection_setup import basic_collection_setup, drop_collection
+from .helpers.collection_setup import drop_collection, recover_collection_from
 from .helpers.helpers import request_with_validation
 
 default_name = ""
 collection_name = 'test_collection_uuid'
 
 
-@pytest.fixture(autouse=True)
-def setup(on_disk_vectors):
-    basic_collection_setup(collection_name=collection_name, on_disk_vectors=on_disk_vectors)
-    yield
+@pytest.fixture(scope="module")
+def seed_snapshot(basic_collection_snapshot, on_disk_vectors):
+    yield basic_collection_snapshot(on_disk_vectors)
     drop_collection(collection_name=collection_name)
 
 
+@pytest.fixture(autouse=True)
+def setup(seed_snapshot):
+    # Tests change the collection config, restore it from the snapshot instead of recreating
+    recover_collection_from(seed_snapshot, collection_name)
+
+
 def test_collection_update():
     response = request_with_validation(
         api='/collections/{collection_name}',
@@ -1,14 +1,14 @@
 import pytest
 
-from .helpers.collection_setup import basic_collection_setup, drop_collection
+from .helpers.collection_setup import drop_collection, recover_collection_from
 from .helpers.helpers import request_with_validation
 
 collection_name = 'test_collection_delete'
 
 
-@pytest.fixture(autouse=True)
-def setup(on_disk_vectors):
-    basic_collection_setup(collection_name=collection_name, on_disk_vectors=on_disk_vectors)
+@pytest.fixture(autouse=True, scope="module")
+def setup(basic_collection_snapshot, on_disk_vectors):
+    recover_collection_from(basic_collection_snapshot(on_disk_vectors), collection_name)
     yield
     drop_collection(collection_name=collection_name)
 
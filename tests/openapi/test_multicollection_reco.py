@@ -1,64 +1,65 @@
+import orjson
 import pytest
 
-from .helpers.collection_setup import basic_collection_setup, drop_collection
+from .helpers.collection_setup import drop_collection, recover_collection_from, setup_aux_collection
 from .helpers.helpers import request_with_validation
 
+_LOOKUP_POINTS_JSON = orjson.dumps({
+    "points": [
+        {
+            "id": 1,
+            "vector": {"other": [1.0, 0.0, 0.0, 0.0], "other-5d": [1.0, 0.0, 0.0, 0.0, 0.0]},
+        },
+        {
+            "id": "00000000-0000-0000-0000-000000000000",
+            "vector": {"other": [0.0, 1.0, 0.0, 0.0], "other-5d": [0.0, 1.0, 0.0, 0.0, 0.0]},
+        },
+        {
+            "id": 3,
+            "vector": {"other": [0.0, 0.0, 0.0, 2.0]},
+        },
+    ]
+})
+
 collection_name = 'test_collection_reco'
 collection_name2 = 'test_collection_reco2'
 
 
 @pytest.fixture(autouse=True, scope="module")
-def setup(on_disk_vectors):
-    basic_collection_setup(collection_name=collection_name, on_disk_vectors=on_disk_vectors)
+def setup(basic_collection_snapshot, on_disk_vectors):
+    recover_collection_from(basic_collection_snapshot(on_disk_vectors), collection_name)
     yield
     drop_collection(collection_name=collection_name)
 
 
-def test_recommend_with_wrong_vector_size(on_disk_vectors):
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name2},
+@pytest.fixture(scope="module")
+def lookup_collection(on_disk_vectors):
+    # Lookup collection shared by all tests, vector "other-5d" has a wrong size for the search collection
+    setup_aux_collection(
+        collection_name2,
+        vectors={
+            "other": {
+                "size": 4,
+                "distance": "Dot",
+                "on_disk": on_disk_vectors,
+            },
+            "other-5d": {
+                "size": 5,
+                "distance": "Dot",
+                "on_disk": on_disk_vectors,
+            },
+        },
+        encoded_points=_LOOKUP_POINTS_JSON,
     )
-    assert response.ok
 
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="PUT",
-        path_params={'collection_name': collection_name2},
-        body={
-            "vectors": {
-                "other": {
-                    "size": 5,
-                    "distance": "Dot",
-                    "on_disk": on_disk_vectors,
-                }
-            }
-        }
-    )
-    assert response.ok
+    yield collection_name2
 
-    response = request_with_validation(
-        api='/collections/{collection_name}/points',
-        method="PUT",
-        path_params={'collection_name': collection_name2},
-        query_params={'wait': 'true'},
-        body={
-            "points": [
-                {
-                    "id": 1,
-                    "vector": {"other": [1.0, 0.0, 0.0, 0.0, 0.0]},
-                },
-                {
-                    "id": "00000000-0000-0000-0000-000000000000",
-                    "vector": {"other": [0.0, 1.0, 0.0, 0.0, 0.0]},
-                }
-            ]
-        }
-    )
-    assert response.ok, response.text
+    drop_collection(collection_name=collection_name2)
 
-    response = request_with_validation(
+
+@pytest.mark.parametrize("lookup_vector, expected_status", [("other-5d", 400), ("other", 200)])
+def test_recommend_lookup_vector_size(lookup_vector, expected_status, lookup_collection):
+    request_with_validation(
         api='/collections/{collection_name}/points/recommend',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -68,61 +69,17 @@ def test_recommend_with_wrong_vector_size(on_disk_vectors):
             "with_vector": False,
             "with_payload": True,
             "lookup_from": {
-                "collection": collection_name2,
-                "vector": "other"
+                "collection": lookup_collection,
+                "vector": lookup_vector
             }
-        }
+        },
+        expected_status=expected_status,
     )
-    assert response.status_code == 400, response.text
 
 
-def test_recommend_from_another_collection(on_disk_vectors):
-    # Create another collection with the same vector size.
+def test_recommend_from_another_collection(lookup_collection):
     # Use vectors from the second collection to search in the first collection.
 
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name2},
-    )
-    assert response.ok
-
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="PUT",
-        path_params={'collection_name': collection_name2},
-        body={
-            "vectors": {
-                "other": {
-                    "size": 4,
-                    "distance": "Dot",
-                    "on_disk": on_disk_vectors,
-                }
-            }
-        }
-    )
-    assert response.ok
-
-    response = request_with_validation(
-        api='/collections/{collection_name}/points',
-        method="PUT",
-        path_params={'collection_name': collection_name2},
-        query_params={'wait': 'true'},
-        body={
-            "points": [
-                {
-                    "id": 1,
-                    "vector": {"other": [1.0, 0.0, 0.0, 0.0]},
-                },
-                {
-                    "id": "00000000-0000-0000-0000-000000000000",
-                    "vector": {"other": [0.0, 1.0, 0.0, 0.0]},
-                }
-            ]
-        }
-    )
-    assert response.ok, response.text
-
     response = request_with_validation(
         api='/collections/{collection_name}/points/recommend',
         method="POST",
@@ -133,7 +90,7 @@ def test_recommend_from_another_collection(on_disk_vectors):
             "with_vector": False,
             "with_payload": True,
             "lookup_from": {
-                "collection": collection_name2,
+                "collection": lookup_collection,
                 "vector": "other"
             }
         }
@@ -155,7 +112,7 @@ def test_recommend_from_another_collection(on_disk_vectors):
                     "with_vector": False,
                     "with_payload": True,
                     "lookup_from": {
-                        "collection": collection_name2,
+                        "collection": lookup_collection,
                         "vector": "other"
                     }
                 },
@@ -165,7 +122,7 @@ def test_recommend_from_another_collection(on_disk_vectors):
                     "with_vector": False,
                     "with_payload": True,
                     "lookup_from": {
-                        "collection": collection_name2,
+                        "collection": lookup_collection,
                         "vector": "other"
                     }
                 },
@@ -188,7 +145,7 @@ def test_recommend_from_another_collection(on_disk_vectors):
     # vector with the largest 2nd element
     assert response.json()['result'][1][0]['id'] == 7
 
-    response = request_with_validation(
+    request_with_validation(
         api='/collections/{collection_name}/points/recommend',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -199,11 +156,11 @@ def test_recommend_from_another_collection(on_disk_vectors):
                 "collection": "unknown_collection",
                 "vector": "other"
             }
-        }
+        },
+        expected_status=404,
     )
-    assert response.status_code == 404
 
-    response = request_with_validation(
+    request_with_validation(
         api='/collections/{collection_name}/points/recommend',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -211,14 +168,14 @@ def test_recommend_from_another_collection(on_disk_vectors):
             "limit": 3,
             "positive": [1],
             "lookup_from": {
-                "collection": collection_name2,
+                "collection": lookup_collection,
                 "vector": "unknown_vector"
             }
-        }
+        },
+        expected_status=400,
     )
-    assert response.status_code == 400, response.text
 
-    response = request_with_validation(
+    request_with_validation(
         api='/collections/{collection_name}/points/recommend',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -226,67 +183,15 @@ def test_recommend_from_another_collection(on_disk_vectors):
             "limit": 3,
             "positive": [2],
             "lookup_from": {
-                "collection": collection_name2,
+                "collection": lookup_collection,
                 "vector": "unknown_vector"
             }
-        }
-    )
-    assert response.status_code == 404, response.text
-
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name2},
-    )
-    assert response.ok
-
-
-def test_recommend_lookup():
-    # delete lookup collection if exists
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name2},
-    )
-    assert response.ok, response.text
-
-    # re-create lookup collection
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="PUT",
-        path_params={'collection_name': collection_name2},
-        body={
-            "vectors": {
-                "other": {
-                    "size": 4,
-                    "distance": "Dot",
-                }
-            }
-        }
+        },
+        expected_status=404,
     )
-    assert response.ok, response.text
 
-    # insert vectors to lookup collection
-    response = request_with_validation(
-        api='/collections/{collection_name}/points',
-        method="PUT",
-        path_params={'collection_name': collection_name2},
-        query_params={'wait': 'true'},
-        body={
-            "points": [
-                {
-                    "id": 1,
-                    "vector": {"other": [1.0, 0.0, 0.0, 0.0]},
-                },
-                {
-                    "id": 2,
-                    "vector": {"other": [0.0, 0.0, 0.0, 2.0]},
-                },
-            ]
-        }
-    )
-    assert response.ok, response.text
 
+def test_recommend_lookup(lookup_collection):
     # check recommend by id + lookup_from
     response = request_with_validation(
         api="/collections/{collection_name}/points/recommend",
@@ -294,10 +199,10 @@ def test_recommend_lookup():
         path_params={"collection_name": collection_name},
         body={
             "positive": [1],
-            "negative": [2],
+            "negative": [3],
             "limit": 10,
             "lookup_from": {
-                "collection": collection_name2,
+                "collection": lookup_collection,
                 "vector": "other"
             }
         },
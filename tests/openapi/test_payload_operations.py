@@ -1,145 +1,139 @@
 import pytest
 
-from .helpers.collection_setup import basic_collection_setup, drop_collection
-from .helpers.helpers import request_with_validation
+from .helpers.collection_setup import batch_update, drop_collection, minimal_collection_setup
+from .helpers.helpers import request_json_with_validation, request_with_validation
+
+# Shared by several requests below, the helpers never modify their arguments
+WAIT_TRUE = {'wait': 'true'}
+POINTS_6 = [6]
+FILTER_HAS_ID_6 = {"must": [{"has_id": POINTS_6}]}
+FILTER_KEY4_AAA = {"must": [{"key": "key4", "match": {"value": "aaa"}}]}
+FILTER_KEY5_BBB = {"must": [{"key": "key5", "match": {"value": "bbb"}}]}
 
 collection_name = 'test_collection_payload'
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def setup(on_disk_vectors):
-    basic_collection_setup(collection_name=collection_name, on_disk_vectors=on_disk_vectors)
+    # Created once per module, the tests below touch disjoint points and don't need a fresh copy.
+    # Only the points they use are upserted
+    minimal_collection_setup(
+        collection_name,
+        [1, 2, 3, 4, 6, 7, 9],
+        on_disk_vectors,
+        # Nested key updates must leave the other top level keys alone
+        payloads={1: {"city": "Berlin", "price": 10.0}},
+    )
     yield
     drop_collection(collection_name=collection_name)
 
 
-def test_payload_operations():
+def test_payload_set_clear_delete():
     # create payload
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
+        query_params=WAIT_TRUE,
         body={
             "payload": {"test_payload": "keyword"},
-            "points": [6]
+            "points": POINTS_6
         }
     )
     assert response.ok
 
     # check payload
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 1
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 1
 
     # clean payload by filter
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload/clear',
         method="POST",
         path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
+        query_params=WAIT_TRUE,
         body={
-            "filter": {
-                "must": [
-                    {"has_id": [6]}
-                ]
-            }
+            "filter": FILTER_HAS_ID_6
         }
     )
     assert response.ok
 
     # check payload
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 0
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 0
 
-    # create payload
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/payload',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
-        body={
-            "payload": {"test_payload": "keyword"},
-            "points": [6]
-        }
-    )
-    assert response.ok
-
-    # delete payload by id
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/payload/delete',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
-        body={
-            "keys": ["test_payload"],
-            "points": [6]
-        }
-    )
-    assert response.ok
+    # create payload and delete it by id, applied in order within one update
+    batch_update(collection_name, [
+        {
+            "set_payload": {
+                "payload": {"test_payload": "keyword"},
+                "points": POINTS_6
+            }
+        },
+        {
+            "delete_payload": {
+                "keys": ["test_payload"],
+                "points": POINTS_6
+            }
+        },
+    ])
 
     # check payload
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 0
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 0
+
 
-    #
-    # test PUT vs POST of the payload - set vs overwrite
-    #
+def test_payload_set_vs_overwrite():
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
         method="PUT",
         path_params={'collection_name': collection_name},
         body={
             "payload": {"key1": "aaa", "key2": "bbb"},
-            "points": [6]
+            "points": [7]
         }
     )
     assert response.ok
 
-    # check payload
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/{id}',
-        method="GET",
-        path_params={'collection_name': collection_name, 'id': 6},
-    )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 2
-
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
         body={
             "payload": {"key1": "ccc"},
-            "points": [6]
+            "points": [7]
         }
     )
     assert response.ok
 
     # check payload
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
-        path_params={'collection_name': collection_name, 'id': 6},
+        path_params={'collection_name': collection_name, 'id': 7},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 2
-    assert response.json()['result']['payload']["key1"] == "ccc"
-    assert response.json()['result']['payload']["key2"] == "bbb"
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 2
+    assert resp.json['result']['payload']["key1"] == "ccc"
+    assert resp.json['result']['payload']["key2"] == "bbb"
 
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
@@ -147,101 +141,87 @@ def test_payload_operations():
         path_params={'collection_name': collection_name},
         body={
             "payload": {"key2": "eee"},
-            "points": [6]
+            "points": [7]
         }
     )
     assert response.ok
 
     # check payload
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
-        path_params={'collection_name': collection_name, 'id': 6},
+        path_params={'collection_name': collection_name, 'id': 7},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 1
-    assert response.json()['result']['payload']["key2"] == "eee"
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 1
+    assert resp.json['result']['payload']["key2"] == "eee"
 
-    #
-    # Check set and update of payload by filter
-    #
+
+def test_payload_by_filter():
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
         body={
             "payload": {"key4": "aaa"},
-            "points": [1, 2, 3]
+            "points": [2, 3, 4]
         }
     )
     assert response.ok
 
     response = request_with_validation(
-        api='/collections/{collection_name}/points/scroll',
+        api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
         body={
-            "filter": {
-                "must": [
-                    {
-                        "key": "key4",
-                        "match": {
-                            "value": "aaa"
-                        }
-                    }
-                ]
-            }
+            "payload": {"key5": "bbb"},
+            "filter": FILTER_KEY4_AAA
         }
     )
     assert response.ok
-    assert len(response.json()['result']['points']) == 3
+
+    resp = request_json_with_validation(
+        api='/collections/{collection_name}/points/scroll',
+        method="POST",
+        path_params={'collection_name': collection_name},
+        body={
+            "filter": FILTER_KEY5_BBB
+        }
+    )
+    assert resp.ok
+    assert len(resp.json['result']['points']) == 3
 
     response = request_with_validation(
-        api='/collections/{collection_name}/points/payload',
+        api='/collections/{collection_name}/points/payload/delete',
         method="POST",
         path_params={'collection_name': collection_name},
         body={
-            "payload": {"key5": "bbb"},
-            "filter": {
-                "must": [
-                    {
-                        "key": "key4",
-                        "match": {
-                            "value": "aaa"
-                        }
-                    }
-                ]
-            }
+            "keys": ["key5"],
+            "filter": FILTER_KEY5_BBB
         }
     )
     assert response.ok
 
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
         body={
-            "filter": {
-                "must": [
-                    {
-                        "key": "key5",
-                        "match": {
-                            "value": "bbb"
-                        }
-                    }
-                ]
-            }
+            "filter": FILTER_KEY5_BBB
         }
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 3
+    assert resp.ok
+    assert len(resp.json['result']['points']) == 0
 
+
+def test_payload_nested_key():
     # set property of payload by empty key
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
+        query_params=WAIT_TRUE,
         body={
             "payload": {"key6": "xxx"},
             "points": [1],
@@ -250,14 +230,17 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 1},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 5
-    assert response.json()['result']['payload']['key6'] == "xxx"
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 3
+    assert resp.json['result']['payload']['city'] == "Berlin"
+    assert resp.json['result']['payload']['price'] == 10.0
+    assert resp.json['result']['payload']['key6'] == "xxx"
 
     # set property of payload with top level
     response = request_with_validation(
@@ -284,15 +267,6 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/{id}',
-        method="GET",
-        path_params={'collection_name': collection_name, 'id': 1},
-    )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 5
-    assert response.json()['result']['payload']["key6"]["subkey"] == "yyy"
-
     # set property of payload with nested key
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
@@ -306,15 +280,6 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/{id}',
-        method="GET",
-        path_params={'collection_name': collection_name, 'id': 1},
-    )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 5
-    assert response.json()['result']['payload']["key6"]["subkey2"]["subkey3"] == "yyy"
-
     # set property of payload with array index
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
@@ -328,15 +293,6 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/{id}',
-        method="GET",
-        path_params={'collection_name': collection_name, 'id': 1},
-    )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 5
-    assert response.json()['result']['payload']["key6"]["arraykey"][0]["a1"]["a1k"] == "yyy"
-
     # set property of payload with array full index
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
@@ -350,15 +306,6 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/{id}',
-        method="GET",
-        path_params={'collection_name': collection_name, 'id': 1},
-    )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 5
-    assert response.json()['result']['payload']["key6"]["arraykey"][1]["a2"]["a2k"] == "yyy"
-
     # set property of payload with not exists key
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
@@ -372,21 +319,30 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
+    # each update above touches a different path of key6, check them all at once
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 1},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 5
-    assert response.json()['result']['payload']["key6"]["subkey7"]["key"] == "xxx"
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 3
+    assert resp.json['result']['payload']['city'] == "Berlin"
+    assert resp.json['result']['payload']['price'] == 10.0
+    assert resp.json['result']['payload']["key6"]["subkey"] == "yyy"
+    assert resp.json['result']['payload']["key6"]["subkey2"]["subkey3"] == "yyy"
+    assert resp.json['result']['payload']["key6"]["arraykey"][0]["a1"]["a1k"] == "yyy"
+    assert resp.json['result']['payload']["key6"]["arraykey"][1]["a2"]["a2k"] == "yyy"
+    assert resp.json['result']['payload']["key6"]["subkey7"]["key"] == "xxx"
+
 
-    # Idempotence test.
+def test_payload_nested_key_idempotence():
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
+        query_params=WAIT_TRUE,
         body={
             "payload": {"key": "xxx"},
             "points": [9],
@@ -395,20 +351,21 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 9},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 1
-    assert response.json()['result']['payload']["key"] == {"key": "xxx"}
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 1
+    assert resp.json['result']['payload']["key"] == {"key": "xxx"}
 
     response = request_with_validation(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
+        query_params=WAIT_TRUE,
         body={
             "payload": {"key": "xxx"},
             "points": [9],
@@ -417,62 +374,26 @@ def test_payload_operations():
     )
     assert response.ok
 
-    response = request_with_validation(
+    resp = request_json_with_validation(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 9},
+        validate_response=False,
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 1
-    assert response.json()['result']['payload']["key"] == {"key": "xxx"}
-
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/payload/delete',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        body={
-            "keys": ["key5"],
-            "filter": {
-                "must": [
-                    {
-                        "key": "key5",
-                        "match": {
-                            "value": "bbb"
-                        }
-                    }
-                ]
-            }
-        }
-    )
-    assert response.ok
-
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/scroll',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        body={
-            "filter": {
-                "must": [
-                    {
-                        "key": "key5",
-                        "match": {
-                            "value": "bbb"
-                        }
-                    }
-                ]
-            }
-        }
-    )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 0
+    assert resp.ok
+    assert len(resp.json['result']['payload']) == 1
+    assert resp.json['result']['payload']["key"] == {"key": "xxx"}
 
 
-def test_payload_index_overwrite():
-    drop_collection(collection_name)
+@pytest.fixture
+def index_overwrite_collection():
+    # A collection of its own, the test sets up its own payload schema and keeps the shared one intact
+    index_collection_name = 'test_collection_payload_index_overwrite'
+    drop_collection(index_collection_name)
     response = request_with_validation(
         api="/collections/{collection_name}",
         method="PUT",
-        path_params={"collection_name": collection_name},
+        path_params={"collection_name": index_collection_name},
         body={
             "vectors": {
                 "size": 4,
@@ -481,13 +402,19 @@ def test_payload_index_overwrite():
         },
     )
     assert response.ok
+    yield index_collection_name
+    drop_collection(index_collection_name)
+
+
+def test_payload_index_overwrite(index_overwrite_collection):
+    collection_name = index_overwrite_collection
 
     for field in ["a.x", "a.y", "b", "nested.a.x", "nested.a.y", "nested.b"]:
         response = request_with_validation(
             api="/collections/{collection_name}/index",
             method="PUT",
             path_params={"collection_name": collection_name},
-            query_params={"wait": "true"},
+            query_params=WAIT_TRUE,
             body={
                 "field_name": field,
                 "field_schema": "integer",
@@ -499,7 +426,7 @@ def test_payload_index_overwrite():
         api="/collections/{collection_name}/points",
         method="PUT",
         path_params={"collection_name": collection_name},
-        query_params={"wait": "true"},
+        query_params=WAIT_TRUE,
         body={
             "points": [
                 {
@@ -1,15 +1,25 @@
 import pytest
 from datetime import datetime
 
-from .helpers.collection_setup import basic_collection_setup, drop_collection
+from .helpers.collection_setup import drop_collection, recover_collection_from
 from .helpers.helpers import request_with_validation
 
 collection_name = 'test_collection_telemetry'
 
 
+@pytest.fixture(params=[False, pytest.param(True, marks=pytest.mark.slow)], scope="module")
+def on_disk_vectors(request):
+    """
+    Metrics and telemetry don't depend on the storage type, so the on-disk
+    variant only re-runs the same checks against a slower to create collection.
+    It is marked as slow: pull request CI skips it, the full matrix still runs on push.
+    """
+    return request.param
+
+
 @pytest.fixture(autouse=True, scope="module")
-def setup(on_disk_vectors):
-    basic_collection_setup(collection_name=collection_name, on_disk_vectors=on_disk_vectors)
+def setup(basic_collection_snapshot, on_disk_vectors):
+    recover_collection_from(basic_collection_snapshot(on_disk_vectors), collection_name)
     yield
     drop_collection(collection_name=collection_name)
 